@@ -10,15 +10,127 @@ import re
 import logging
 import time
 import json
+import unicodedata
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, NamedTuple, Iterator, Set
 from dotenv import load_dotenv
 from plexapi.server import PlexServer
 from plexapi.library import LibrarySection
 from plexapi.video import Movie, Episode
 from tqdm import tqdm
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import requests
+from requests.adapters import HTTPAdapter
+
+# orjson is much faster for large caches, fall back to stdlib json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson streams the cache file on load instead of reading it into memory first
+try:
+    import ijson
+    _IJSON_ERRORS = (ijson.JSONError,)
+except ImportError:
+    ijson = None
+    _IJSON_ERRORS = ()
+
+
+# videos.list accepts at most 50 comma-separated IDs per request
+YOUTUBE_BATCH_SIZE = 50
+
+# Default YouTube Data API limit is 300 queries per 100 seconds
+YOUTUBE_REQUESTS_PER_SECOND = 300 / 100
+YOUTUBE_REQUEST_BURST = 10
+
+# Items fetched per Plex library page (plexapi defaults to 100)
+PLEX_CONTAINER_SIZE = 500
+
+# Number of Plex edit requests kept in flight at once
+PLEX_EDIT_WORKERS = 16
+
+# Pooled HTTP connections to Plex, must be at least PLEX_EDIT_WORKERS
+PLEX_POOL_SIZE = 32
+
+# YouTube IDs are 11 characters long, alphanumeric plus - and _
+# Tried in priority order, so "Song (Lyric-Video) [dQw4w9WgXcQ].mkv" picks the
+# bracketed ID even though the parenthesised word comes first
+_YOUTUBE_ID_PATTERNS = (
+    re.compile(r'\[([a-zA-Z0-9_-]{11})\]'),  # [video_id]
+    re.compile(r'\(([a-zA-Z0-9_-]{11})\)'),  # (video_id)
+    re.compile(r'_([a-zA-Z0-9_-]{11})\.(?:mp4|mkv|avi)'),  # _video_id.mp4/.mkv/.avi
+)
+
+# State files live next to this script, resolved once at import
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_CACHE_FILE = os.path.join(_SCRIPT_DIR, "youtube_metadata_cache.json")
+_CACHE_LOG_FILE = os.path.join(_SCRIPT_DIR, "youtube_metadata_cache.jsonl")
+_DONE_FILE = os.path.join(_SCRIPT_DIR, "youtube_done.txt")
+
+# Problematic title characters and their replacements
+_SANITIZE_TABLE = str.maketrans({
+    '/': '-',
+    '\\': '-',
+    ':': ' -',
+    '*': '',
+    '?': '',
+    '"': "'",
+    '<': '(',
+    '>': ')',
+    '|': '-',
+    '\n': ' ',
+    '\r': ' ',
+    '\t': ' '
+})
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class YTMeta(NamedTuple):
+    """YouTube metadata for a single video, as stored in the cache."""
+    title: str
+    channel_name: str
+    description: str
+    published_at: str
+    publish_date: str = ''  # published_at as YYYY-MM-DD, '' if unparseable
+    
+    @classmethod
+    def from_dict(cls, entry: Dict[str, str]) -> 'YTMeta':
+        """Build from a serialized cache entry, missing fields default to ''."""
+        metadata = cls(*(entry.get(field, '') for field in cls._fields))
+        if metadata.published_at and not metadata.publish_date:
+            # Entries cached before publish_date existed
+            metadata = metadata._replace(publish_date=to_publish_date(metadata.published_at))
+        return metadata
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` calls per second with bursts of up to `burst` calls."""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+    
+    def wait(self) -> None:
+        """Take a token, sleeping only when the bucket is empty."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return
+        
+        time.sleep((1 - self.tokens) / self.rate)
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+
+
+_youtube_limiter = RateLimiter(YOUTUBE_REQUESTS_PER_SECOND, YOUTUBE_REQUEST_BURST)
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -32,42 +144,174 @@ def setup_logging(level: str = "INFO") -> None:
 
 def get_cache_file_path() -> str:
     """Get the path for the YouTube metadata cache file."""
-    # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(script_dir, "youtube_metadata_cache.json")
+    return _CACHE_FILE
+
+
+def get_cache_log_path() -> str:
+    """Get the path for the append-only log of new cache entries."""
+    return _CACHE_LOG_FILE
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
 
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
 
-def load_cache() -> Dict[str, Dict[str, str]]:
-    """Load YouTube metadata cache from file."""
+
+def load_cache() -> Dict[str, YTMeta]:
+    """Load YouTube metadata cache from file, then replay the cache log on top."""
     cache_file = get_cache_file_path()
+    cache = {}
     
     if not os.path.exists(cache_file):
         logging.info("No cache file found, starting with empty cache")
-        return {}
+    else:
+        try:
+            with open(cache_file, 'rb') as f:
+                entries = ijson.kvitems(f, '') if ijson else _json_loads(f.read()).items()
+                cache = {video_id: YTMeta.from_dict(entry) for video_id, entry in entries}
+            logging.info(f"Loaded cache with {len(cache)} entries from {cache_file}")
+        except (json.JSONDecodeError, *_IJSON_ERRORS, IOError) as e:
+            logging.warning(f"Failed to load cache file: {e}. Starting with empty cache.")
+            cache = {}
+    
+    replay_cache_log(cache)
+    return cache
+
+
+def replay_cache_log(cache: Dict[str, YTMeta]) -> int:
+    """
+    Apply entries from the cache log that were not yet compacted into the cache file.
+    Returns the number of entries replayed.
+    """
+    log_file = get_cache_log_path()
+    
+    if not os.path.exists(log_file):
+        return 0
+    
+    replayed = 0
+    try:
+        with open(log_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entries = _json_loads(line)
+                except json.JSONDecodeError as e:
+                    # A run interrupted mid-write can leave a partial last line
+                    logging.warning(f"Skipping invalid cache log line: {e}")
+                    continue
+                for video_id, entry in entries.items():
+                    cache[video_id] = YTMeta.from_dict(entry)
+                replayed += len(entries)
+    except IOError as e:
+        logging.warning(f"Failed to read cache log: {e}")
+    
+    if replayed:
+        logging.info(f"Replayed {replayed} entries from {log_file}")
+    return replayed
+
+
+def open_cache_log():
+    """Open the cache log for appending new entries, or None if it can't be opened."""
+    log_file = get_cache_log_path()
     
     try:
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            cache = json.load(f)
-        logging.info(f"Loaded cache with {len(cache)} entries from {cache_file}")
-        return cache
-    except (json.JSONDecodeError, IOError) as e:
-        logging.warning(f"Failed to load cache file: {e}. Starting with empty cache.")
-        return {}
+        return open(log_file, 'ab')
+    except IOError as e:
+        logging.error(f"Failed to open cache log: {e}")
+        return None
 
 
-def save_cache(cache: Dict[str, Dict[str, str]]) -> None:
-    """Save YouTube metadata cache to file."""
+def save_cache(cache: Dict[str, YTMeta]) -> bool:
+    """Save YouTube metadata cache to file. Returns True on success."""
     cache_file = get_cache_file_path()
     
     try:
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
+        data = _json_dumps({video_id: metadata._asdict() for video_id, metadata in cache.items()}, indent=True)
+        # Write a temp file and swap it in, so a crash mid-write keeps the old cache intact
+        tmp_file = cache_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
         logging.debug(f"Saved cache with {len(cache)} entries to {cache_file}")
+        return True
     except IOError as e:
         logging.error(f"Failed to save cache file: {e}")
+        return False
+
+
+def compact_cache(cache: Dict[str, YTMeta], cache_log) -> bool:
+    """Write the full cache to file and empty the cache log once it is saved."""
+    if not save_cache(cache):
+        return False
+    
+    if cache_log:
+        try:
+            cache_log.truncate(0)
+        except IOError as e:
+            logging.error(f"Failed to truncate cache log: {e}")
+    return True
 
 
-def get_cached_metadata(cache: Dict[str, Dict[str, str]], video_id: str) -> Optional[Dict[str, str]]:
+def get_done_file_path() -> str:
+    """Get the path for the file tracking Plex items that are fully updated."""
+    return _DONE_FILE
+
+
+def done_key(library: LibrarySection, item, video_id: str) -> str:
+    """
+    Key a done entry by library, Plex item and YouTube ID, so the same video in
+    another library, or a file re-added to Plex as a new item, is still processed.
+    """
+    return f"{library.key}:{item.ratingKey}:{video_id}"
+
+
+def load_done_ids() -> Set[str]:
+    """Load the set of done keys for Plex items that need no further updates."""
+    done_file = get_done_file_path()
+    
+    if not os.path.exists(done_file):
+        return set()
+    
+    try:
+        with open(done_file, 'r', encoding='utf-8') as f:
+            done_ids = set(f.read().split())
+        logging.info(f"Loaded {len(done_ids)} already updated items from {done_file}")
+        return done_ids
+    except IOError as e:
+        logging.warning(f"Failed to load done file: {e}. Processing all items.")
+        return set()
+
+
+def open_done_file():
+    """Open the done file for appending, or None if it can't be opened."""
+    done_file = get_done_file_path()
+    
+    try:
+        return open(done_file, 'a', encoding='utf-8')
+    except IOError as e:
+        logging.error(f"Failed to open done file: {e}")
+        return None
+
+
+def mark_done(done_ids: Set[str], done_file, key: str) -> None:
+    """Record that the Plex item for a done key is up to date."""
+    if key in done_ids:
+        return
+    done_ids.add(key)
+    if done_file:
+        done_file.write(key + '\n')
+        done_file.flush()
+
+
+def get_cached_metadata(cache: Dict[str, YTMeta], video_id: str) -> Optional[YTMeta]:
     """Get metadata from cache if available."""
     if video_id in cache:
         logging.debug(f"Cache hit for video ID: {video_id}")
@@ -75,9 +319,12 @@ def get_cached_metadata(cache: Dict[str, Dict[str, str]], video_id: str) -> Opti
     return None
 
 
-def cache_metadata(cache: Dict[str, Dict[str, str]], video_id: str, metadata: Dict[str, str]) -> None:
-    """Add metadata to cache."""
+def cache_metadata(cache: Dict[str, YTMeta], video_id: str, metadata: YTMeta, cache_log=None) -> None:
+    """Add metadata to cache and append it to the cache log if one is open."""
     cache[video_id] = metadata
+    if cache_log:
+        cache_log.write(_json_dumps({video_id: metadata._asdict()}) + b'\n')
+        cache_log.flush()
     logging.debug(f"Cached metadata for video ID: {video_id}")
 
 
@@ -92,18 +339,8 @@ def extract_youtube_id(file_path: str) -> Optional[str]:
     # Get just the filename from the full path
     filename = os.path.basename(file_path)
     
-    # Pattern to match YouTube video IDs in square brackets or parentheses
-    # YouTube IDs are 11 characters long, alphanumeric plus - and _
-    patterns = [
-        r'\[([a-zA-Z0-9_-]{11})\]',  # [video_id]
-        r'\(([a-zA-Z0-9_-]{11})\)',  # (video_id)
-        r'_([a-zA-Z0-9_-]{11})\.mp4',  # _video_id.mp4
-        r'_([a-zA-Z0-9_-]{11})\.mkv',  # _video_id.mkv
-        r'_([a-zA-Z0-9_-]{11})\.avi',  # _video_id.avi
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, filename)
+    for pattern in _YOUTUBE_ID_PATTERNS:
+        match = pattern.search(filename)
         if match:
             video_id = match.group(1)
             logging.debug(f"Extracted YouTube ID '{video_id}' from: {filename}")
@@ -113,52 +350,80 @@ def extract_youtube_id(file_path: str) -> Optional[str]:
     return None
 
 
-def get_youtube_metadata(youtube_service, video_id: str, cache: Dict[str, Dict[str, str]]) -> Optional[Dict[str, str]]:
+class YouTubeClient:
+    """Minimal YouTube Data API client, only the videos.list endpoint is needed."""
+    
+    VIDEOS_URL = 'https://www.googleapis.com/youtube/v3/videos'
+    
+    def __init__(self, api_key: str, session: requests.Session):
+        self.api_key = api_key
+        self.session = session
+    
+    def list_videos(self, video_ids: List[str]) -> Dict:
+        """Return the videos.list response with snippets for up to YOUTUBE_BATCH_SIZE IDs."""
+        response = self.session.get(self.VIDEOS_URL, params={
+            'part': 'snippet',
+            'id': ','.join(video_ids),
+            'maxResults': YOUTUBE_BATCH_SIZE,
+            'key': self.api_key
+        }, timeout=30)
+        response.raise_for_status()
+        return response.json()
+
+
+def build_metadata(video_info: Dict) -> YTMeta:
+    """Build a cache entry from a YouTube API video snippet."""
+    return YTMeta(
+        title=video_info.get('title', ''),
+        channel_name=video_info.get('channelTitle', ''),
+        description=video_info.get('description', ''),
+        published_at=video_info.get('publishedAt', ''),
+        publish_date=to_publish_date(video_info.get('publishedAt', ''))
+    )
+
+
+def fetch_youtube_metadata_batch(youtube_service, video_ids: List[str], cache: Dict[str, YTMeta],
+                                 cache_log=None) -> int:
     """
-    Get video metadata from YouTube API or cache.
-    Returns dict with 'title' and 'channel_name' or None if not found.
+    Fetch metadata for many videos from YouTube API and add it to the cache.
+    Up to YOUTUBE_BATCH_SIZE IDs are sent per videos.list request, which costs
+    the same quota as a single ID. Returns the number of API calls made.
     """
-    # Check cache first
-    cached_metadata = get_cached_metadata(cache, video_id)
-    if cached_metadata:
-        return cached_metadata
+    api_calls = 0
+    ids_iter = iter(video_ids)
     
-    try:
-        # Request video details from YouTube API
-        request = youtube_service.videos().list(
-            part="snippet",
-            id=video_id
-        )
-        response = request.execute()
-        
-        if not response.get('items'):
-            logging.warning(f"No video found for ID: {video_id}")
-            return None
-        
-        video_info = response['items'][0]['snippet']
-        
-        metadata = {
-            'title': video_info.get('title', ''),
-            'channel_name': video_info.get('channelTitle', ''),
-            'description': video_info.get('description', ''),
-            'published_at': video_info.get('publishedAt', '')
-        }
-        
-        # Cache the metadata
-        cache_metadata(cache, video_id, metadata)
+    while True:
+        chunk = list(islice(ids_iter, YOUTUBE_BATCH_SIZE))
+        if not chunk:
+            break
         
-        logging.debug(f"Retrieved and cached metadata for {video_id}: {metadata['channel_name']} - {metadata['title']}")
-        return metadata
+        _youtube_limiter.wait()
+        try:
+            # Request details for the whole chunk in one call
+            response = youtube_service.list_videos(chunk)
+            api_calls += 1
+        except requests.HTTPError as e:
+            # Don't log the exception itself, its message includes the API key in the URL
+            status = e.response.status_code
+            if status == 403:
+                logging.error("YouTube API quota exceeded or invalid API key")
+            else:
+                logging.error(f"YouTube API error for videos {','.join(chunk)}: {status} {e.response.reason}")
+            continue
+        except requests.RequestException as e:
+            # Connection and timeout errors also carry the request URL, log the type only
+            logging.error(f"Error getting YouTube metadata for {len(chunk)} videos: {type(e).__name__}")
+            continue
+        except Exception as e:
+            logging.error(f"Error getting YouTube metadata for {len(chunk)} videos: {e}")
+            continue
         
-    except HttpError as e:
-        if e.resp.status == 403:
-            logging.error("YouTube API quota exceeded or invalid API key")
-        else:
-            logging.error(f"YouTube API error for video {video_id}: {e}")
-        return None
-    except Exception as e:
-        logging.error(f"Error getting YouTube metadata for {video_id}: {e}")
-        return None
+        for video in response.get('items', []):
+            metadata = build_metadata(video['snippet'])
+            cache_metadata(cache, video['id'], metadata, cache_log)
+            logging.debug(f"Retrieved and cached metadata for {video['id']}: {metadata.channel_name} - {metadata.title}")
+    
+    return api_calls
 
 
 def sanitize_filename(text: str) -> str:
@@ -166,27 +431,11 @@ def sanitize_filename(text: str) -> str:
     Sanitize text to be safe for use as a filename/title.
     Remove or replace problematic characters.
     """
-    # Replace problematic characters
-    replacements = {
-        '/': '-',
-        '\\': '-',
-        ':': ' -',
-        '*': '',
-        '?': '',
-        '"': "'",
-        '<': '(',
-        '>': ')',
-        '|': '-',
-        '\n': ' ',
-        '\r': ' ',
-        '\t': ' '
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    # Replace problematic characters in a single pass
+    text = text.translate(_SANITIZE_TABLE)
     
     # Remove multiple spaces and trim
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
     
     # Limit length
     if len(text) > 200:
@@ -195,19 +444,47 @@ def sanitize_filename(text: str) -> str:
     return text
 
 
+def _norm(text: Optional[str]) -> str:
+    """Normalize text to NFC so equal strings compare equal regardless of encoding form."""
+    return unicodedata.normalize('NFC', text or '')
+
+
+@lru_cache(maxsize=4096)
+def channel_title_prefix(channel_name: str) -> str:
+    """Get the '<channel name> - ' prefix of new titles, memoized since channels repeat."""
+    return f"{sanitize_filename(channel_name)} - "
+
+
 def create_new_title(channel_name: str, video_title: str) -> str:
     """Create new title in format: <channel name> - <video title>"""
-    channel_clean = sanitize_filename(channel_name)
     title_clean = sanitize_filename(video_title)
     
-    new_title = f"{channel_clean} - {title_clean}"
+    new_title = f"{channel_title_prefix(channel_name)}{title_clean}"
     return new_title
 
 
+def looks_up_to_date(item, metadata: YTMeta) -> bool:
+    """
+    Cheap check for items an earlier run already updated: the title is exactly the
+    new title, the publish date matches and some summary is set. Summary content
+    is not compared, so a stale but non-empty summary is left as is.
+    """
+    if not item.title.startswith(channel_title_prefix(metadata.channel_name)):
+        return False
+    if _norm(item.title) != _norm(create_new_title(metadata.channel_name, metadata.title)):
+        return False
+    current_date = item.originallyAvailableAt
+    return (bool(item.summary)
+            and current_date is not None
+            and current_date.strftime('%Y-%m-%d') == metadata.publish_date)
+
+
+@lru_cache(maxsize=4096)
 def parse_youtube_date(published_at: str) -> Optional[datetime]:
     """
     Parse YouTube's published date format to datetime object.
     YouTube returns dates in ISO 8601 format: 2023-12-25T10:30:00Z
+    Results are memoized, so the logging below only happens once per string.
     """
     if not published_at:
         return None
@@ -226,6 +503,12 @@ def parse_youtube_date(published_at: str) -> Optional[datetime]:
         return None
 
 
+def to_publish_date(published_at: str) -> str:
+    """Convert YouTube's published date to YYYY-MM-DD, or '' if it can't be parsed."""
+    dt = parse_youtube_date(published_at)
+    return dt.date().isoformat() if dt else ''
+
+
 def connect_to_plex(url: str, token: str) -> PlexServer:
     """Connect to Plex server."""
     try:
@@ -234,12 +517,15 @@ def connect_to_plex(url: str, token: str) -> PlexServer:
         import urllib3
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         
-        session = None
+        session = requests.Session()
         if url.startswith('https://'):
-            import requests
-            session = requests.Session()
             session.verify = False
         
+        # Keep enough pooled keep-alive connections for all edit workers
+        adapter = HTTPAdapter(pool_connections=PLEX_POOL_SIZE, pool_maxsize=PLEX_POOL_SIZE, max_retries=3)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
         plex = PlexServer(url, token, session=session)
         logging.info(f"Successfully connected to Plex server: {plex.friendlyName}")
         return plex
@@ -284,6 +570,49 @@ def get_library(plex: PlexServer, library_name: Optional[str] = None) -> Library
             exit(0)
 
 
+def iter_library_items(library: LibrarySection) -> Iterator:
+    """
+    Yield all items in library one page at a time instead of loading them all up front.
+    Guid elements are skipped since we never read them.
+    """
+    container_start = 0
+    while True:
+        page = library.search(libtype=library.type, includeGuids=False, container_start=container_start,
+                              container_size=PLEX_CONTAINER_SIZE, maxresults=PLEX_CONTAINER_SIZE)
+        yield from page
+        if len(page) < PLEX_CONTAINER_SIZE:
+            break
+        container_start += PLEX_CONTAINER_SIZE
+
+
+def apply_edits(item, new_title: str, description: str, publish_date: str,
+                flags: Tuple[bool, bool, bool]) -> Tuple[str, List[str], Optional[Exception]]:
+    """
+    Apply title, summary and publish date edits to a Plex item in a single request.
+    Safe to run from a worker thread. Returns (item title, changes, error).
+    """
+    title = item.title
+    title_changed, summary_changed, date_changed = flags
+    changes = []
+    try:
+        # Queue the field edits and send them together with saveEdits()
+        item.batchEdits()
+        if title_changed:
+            item.editTitle(new_title)
+            changes.append("title")
+        if summary_changed and description:
+            item.editSummary(description)
+            changes.append("summary")
+        if date_changed and publish_date:
+            item.editOriginallyAvailable(publish_date)
+            changes.append("publish date")
+        if changes:
+            item.saveEdits()
+    except Exception as e:
+        return title, changes, e
+    return title, changes, None
+
+
 def process_library_items(library: LibrarySection, youtube_service, dry_run: bool = True, verbose: bool = False) -> None:
     """
     Process all items in library, extract YouTube IDs, get metadata, and update titles, summaries, and publish dates.
@@ -293,16 +622,17 @@ def process_library_items(library: LibrarySection, youtube_service, dry_run: boo
     print(f"🧪 Mode: {'DRY RUN' if dry_run else 'LIVE EXECUTION'}")
     print("-" * 80)
     
-    # Load cache
+    # Load cache and open the log that new entries are appended to
     cache = load_cache()
+    cache_log = open_cache_log()
     cache_saves = 0
     
+    # Items in the done file are skipped in live runs only, dry runs still compare them
+    done_ids = load_done_ids()
+    done_file = None if dry_run else open_done_file()
+    
     try:
-        # Get all items
-        logging.info("Fetching library items...")
-        items = library.all()
-        
-        if not items:
+        if not library.totalSize:
             print("No items found in this library.")
             return
         
@@ -311,9 +641,17 @@ def process_library_items(library: LibrarySection, youtube_service, dry_run: boo
         failed_count = 0
         cache_hits = 0
         api_calls = 0
+        skipped_count = 0
         
-        # Process each item
-        for item in tqdm(items, desc="Processing items", unit="item"):
+        # Pass 1: extract YouTube IDs and collect the ones missing from cache,
+        # full batches are fetched while the library is still being paged in.
+        # Scanned items are kept in pending until pass 3, so peak memory still
+        # grows with the library size; paging only gets the first batch out sooner
+        logging.info("Fetching library items...")
+        pending = []
+        missing_ids = {}
+        items = iter_library_items(library)
+        for item in tqdm(items, total=library.totalSize, desc="Scanning items", unit="item"):
             try:
                 # Get file path
                 if not item.media or not item.media[0].parts:
@@ -330,88 +668,97 @@ def process_library_items(library: LibrarySection, youtube_service, dry_run: boo
                     failed_count += 1
                     continue
                 
-                # Check if we already have this in cache
-                cached_metadata = get_cached_metadata(cache, youtube_id)
-                if cached_metadata:
-                    metadata = cached_metadata
+                if not dry_run and done_key(library, item, youtube_id) in done_ids:
+                    skipped_count += 1
+                    continue
+                
+                metadata = get_cached_metadata(cache, youtube_id)
+                if metadata and looks_up_to_date(item, metadata):
+                    # Title and date already match, skip the full comparison. Not marked
+                    # done, since summary content was never compared
                     cache_hits += 1
-                else:
-                    # Get YouTube metadata from API
-                    metadata = get_youtube_metadata(youtube_service, youtube_id, cache)
-                    if metadata:
-                        api_calls += 1
+                    skipped_count += 1
+                    continue
                 
+                pending.append((item, youtube_id))
+                if metadata:
+                    cache_hits += 1
+                else:
+                    missing_ids[youtube_id] = None
+                    if len(missing_ids) >= YOUTUBE_BATCH_SIZE:
+                        api_calls += fetch_youtube_metadata_batch(youtube_service, list(missing_ids), cache, cache_log)
+                        missing_ids.clear()
+            except Exception as e:
+                logging.error(f"Error scanning item {item.title}: {e}")
+                failed_count += 1
+        
+        # Pass 2: fetch the remaining uncached metadata from YouTube API
+        if missing_ids:
+            logging.info(f"Fetching metadata for {len(missing_ids)} videos from YouTube API...")
+            api_calls += fetch_youtube_metadata_batch(youtube_service, list(missing_ids), cache, cache_log)
+        
+        # Pass 3: compare Plex items against cached metadata
+        pending_edits = []
+        edit_done_keys = []
+        for item, youtube_id in tqdm(pending, desc="Processing items", unit="item"):
+            try:
+                metadata = get_cached_metadata(cache, youtube_id)
                 if not metadata:
                     logging.warning(f"Failed to get YouTube metadata for: {youtube_id}")
                     failed_count += 1
                     continue
                 
                 # Create new title
-                new_title = create_new_title(metadata['channel_name'], metadata['title'])
+                new_title = create_new_title(metadata.channel_name, metadata.title)
                 
                 # Get current summary for comparison
                 current_summary = getattr(item, 'summary', '') or ''
-                video_description = metadata.get('description', '')
+                video_description = metadata.description
                 
-                # Parse YouTube publish date
-                youtube_publish_date = parse_youtube_date(metadata.get('published_at', ''))
+                # YouTube publish date is stored as YYYY-MM-DD when cached
+                youtube_publish_date = metadata.publish_date
                 current_date = getattr(item, 'originallyAvailableAt', None)
+                current_date_only = current_date.strftime('%Y-%m-%d') if current_date else ''
                 
                 # Display what would happen
                 if verbose:
                     print(f"\n📹 Current: {item.title}")
                     print(f"🆔 YouTube ID: {youtube_id}")
-                    print(f"📺 Channel: {metadata['channel_name']}")
-                    print(f"🎬 Video Title: {metadata['title']}")
+                    print(f"📺 Channel: {metadata.channel_name}")
+                    print(f"🎬 Video Title: {metadata.title}")
                     print(f"✨ New Title: {new_title}")
                     if video_description:
                         print(f"📝 Description: {video_description[:100]}{'...' if len(video_description) > 100 else ''}")
                     if youtube_publish_date:
-                        print(f"📅 YouTube Published: {youtube_publish_date.strftime('%Y-%m-%d')}")
+                        print(f"📅 YouTube Published: {youtube_publish_date}")
                         if current_date:
-                            print(f"📅 Current Plex Date: {current_date.strftime('%Y-%m-%d')}")
+                            print(f"📅 Current Plex Date: {current_date_only}")
                         else:
                             print(f"📅 Current Plex Date: Not set")
                 
                 # Check what needs updating
-                title_changed = item.title != new_title
-                summary_changed = current_summary != video_description
+                # Plex and YouTube may encode the same text with different Unicode normalization
+                title_changed = _norm(item.title) != _norm(new_title)
+                summary_changed = _norm(current_summary) != _norm(video_description)
                 date_changed = False
                 
                 if youtube_publish_date:
                     if current_date is None:
                         date_changed = True
-                        logging.debug(f"Date missing for {item.title}, will set to {youtube_publish_date.date()}")
+                        logging.debug(f"Date missing for {item.title}, will set to {youtube_publish_date}")
                     else:
                         # Compare dates (ignoring time)
-                        youtube_date_only = youtube_publish_date.date()
-                        current_date_only = current_date.date()
-                        date_changed = youtube_date_only != current_date_only
+                        date_changed = youtube_publish_date != current_date_only
                         if date_changed:
-                            logging.debug(f"Date mismatch for {item.title}: {current_date_only} -> {youtube_date_only}")
+                            logging.debug(f"Date mismatch for {item.title}: {current_date_only} -> {youtube_publish_date}")
                 else:
                     logging.debug(f"No YouTube publish date available for {item.title}")
                 
                 if not dry_run and (title_changed or summary_changed or date_changed):
-                    try:
-                        changes = []
-                        if title_changed:
-                            item.editTitle(new_title)
-                            changes.append("title")
-                        if summary_changed and video_description:
-                            item.editSummary(video_description)
-                            changes.append("summary")
-                        if date_changed and youtube_publish_date:
-                            date_only = youtube_publish_date.date()
-                            item.editOriginallyAvailable(date_only)
-                            changes.append("publish date")                        
-                        if changes:
-                            print(f"✅ Updated {', '.join(changes)} successfully!")
-                            updated_count += 1
-                    except Exception as e:
-                        print(f"❌ Failed to update: {e}")
-                        logging.error(f"Update error for {item.title}: {e}")
-                        failed_count += 1
+                    # Queue the edit, Plex round-trips are overlapped below
+                    pending_edits.append((item, new_title, video_description, youtube_publish_date,
+                                          (title_changed, summary_changed, date_changed)))
+                    edit_done_keys.append(done_key(library, item, youtube_id))
                 elif dry_run and (title_changed or summary_changed or date_changed):
                     changes = []
                     if title_changed:
@@ -422,27 +769,39 @@ def process_library_items(library: LibrarySection, youtube_service, dry_run: boo
                         changes.append("publish date")
                     print(f"🧪 Would update {', '.join(changes)} (dry run)")
                     updated_count += 1
-                elif verbose and not (title_changed or summary_changed or date_changed):
-                    print(f"ℹ️  No changes needed")
+                else:
+                    if verbose:
+                        print(f"ℹ️  No changes needed")
+                    if not dry_run:
+                        mark_done(done_ids, done_file, done_key(library, item, youtube_id))
                 
                 processed_count += 1
                 
-                # Save cache every 10 items
-                if processed_count % 10 == 0:
-                    save_cache(cache)
-                    cache_saves += 1
-                
-                # Small delay to be nice to YouTube API (only if we made an API call)
-                if not cached_metadata:
-                    time.sleep(0.1)
-                
             except Exception as e:
                 logging.error(f"Error processing item {item.title}: {e}")
                 failed_count += 1
                 continue
         
-        # Final cache save
-        save_cache(cache)
+        # Pass 4: apply live edits concurrently, each one is a blocking Plex request
+        if pending_edits:
+            with ThreadPoolExecutor(max_workers=PLEX_EDIT_WORKERS) as executor:
+                results = executor.map(lambda edit: apply_edits(*edit), pending_edits)
+                results = tqdm(results, total=len(pending_edits), desc="Updating items", unit="item")
+                # map() yields results in submission order, so they line up with edit_done_keys.
+                # results goes first so zip() exhausts it and tqdm finishes the bar
+                for (title, changes, error), key in zip(results, edit_done_keys):
+                    if error:
+                        print(f"❌ Failed to update {title}: {error}")
+                        logging.error(f"Update error for {title}: {error}")
+                        failed_count += 1
+                        continue
+                    if changes:
+                        print(f"✅ Updated {', '.join(changes)} for {title}")
+                        updated_count += 1
+                    mark_done(done_ids, done_file, key)
+        
+        # Final cache save, folds the cache log into the cache file
+        compact_cache(cache, cache_log)
         cache_saves += 1
         
         # Summary
@@ -451,6 +810,7 @@ def process_library_items(library: LibrarySection, youtube_service, dry_run: boo
         print(f"📋 Items processed: {processed_count}")
         print(f"✅ Items updated: {updated_count}")
         print(f"❌ Items failed: {failed_count}")
+        print(f"⏭️  Items skipped (already updated): {skipped_count}")
         print(f"💾 Cache hits: {cache_hits}")
         print(f"🌐 API calls: {api_calls}")
         print(f"💾 Cache saves: {cache_saves}")
@@ -460,8 +820,13 @@ def process_library_items(library: LibrarySection, youtube_service, dry_run: boo
     except Exception as e:
         logging.error(f"Error processing library items: {e}")
         # Save cache before raising
-        save_cache(cache)
+        compact_cache(cache, cache_log)
         raise
+    finally:
+        if cache_log:
+            cache_log.close()
+        if done_file:
+            done_file.close()
 
 
 def main():
@@ -491,23 +856,14 @@ def main():
     try:
         # Initialize YouTube API with SSL verification disabled
         logging.info("Initializing YouTube API...")
-        import ssl
-        import httplib2
-        
-        # Create an httplib2.Http object with SSL verification disabled
-        http = httplib2.Http()
-        http.disable_ssl_certificate_validation = True
-        
-        # Also disable SSL verification globally for urllib3 (used by googleapiclient)
         import urllib3
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         
-        # Create SSL context that doesn't verify certificates
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        youtube_session = requests.Session()
+        youtube_session.verify = False
+        youtube_session.mount('https://', HTTPAdapter(max_retries=3))
         
-        youtube = build('youtube', 'v3', developerKey=youtube_api_key, http=http)
+        youtube = YouTubeClient(youtube_api_key, youtube_session)
         
         # Connect to Plex
         plex = connect_to_plex(plex_url, plex_token)